@@ -1,9 +1,22 @@
-from flask import Flask, render_template, request, jsonify
-from scorer import evaluate_introduction
-import json
+from flask import Flask, render_template, request
+import orjson
+from scorer import evaluate_introduction, evaluate_introductions
 
 app = Flask(__name__)
 
+# Upper bound on transcripts accepted by /evaluate_batch in one request
+MAX_BATCH_SIZE = 100
+
+def json_response(payload, status=200):
+    """JSON response encoded with orjson (keys sorted, as jsonify did)"""
+    body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return app.response_class(body, status=status, mimetype='application/json')
+
+def read_json():
+    """Request body decoded with orjson; an empty body reads as {}"""
+    raw = request.get_data(cache=False)
+    return orjson.loads(raw) if raw else {}
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -11,21 +24,58 @@ def index():
 @app.route('/evaluate', methods=['POST'])
 def evaluate():
     try:
-        data = request.get_json()
-        transcript = data.get('transcript', '')
+        data = read_json()
+        transcript = data.get('transcript') or ''
         duration = int(data.get('duration', 52))
         
-        if not transcript.strip():
-            return jsonify({'error': 'Transcript cannot be empty'}), 400
+        # isspace() avoids copying the transcript just to test for emptiness
+        if not transcript or transcript.isspace():
+            return json_response({'error': 'Transcript cannot be empty'}, 400)
         
         # Evaluate the transcript
         results = evaluate_introduction(transcript, duration)
         
-        return jsonify(results)
+        return json_response(results)
+    
+    except Exception as e:
+        return json_response({'error': str(e)}, 500)
+
+@app.route('/evaluate_batch', methods=['POST'])
+def evaluate_batch():
+    try:
+        data = read_json()
+        transcripts = data.get('transcripts') or []
+        
+        # A string or object would otherwise be scored per character or per key
+        if not isinstance(transcripts, list) or not all(isinstance(transcript, str) for transcript in transcripts):
+            return json_response({'error': 'Transcripts must be a list of strings'}, 400)
+        durations = data.get('durations')
+        if durations is None:
+            durations = [data.get('duration', 52)] * len(transcripts)
+        if not isinstance(durations, list) or not all(
+            isinstance(duration, (int, float)) and not isinstance(duration, bool) and duration > 0
+            for duration in durations
+        ):
+            return json_response({'error': 'Durations must be a list of positive numbers'}, 400)
+        if not transcripts:
+            return json_response({'error': 'Transcripts cannot be empty'}, 400)
+        if len(transcripts) > MAX_BATCH_SIZE:
+            return json_response({'error': f'At most {MAX_BATCH_SIZE} transcripts per batch'}, 400)
+        if len(durations) != len(transcripts):
+            return json_response({'error': 'Durations must match transcripts'}, 400)
+        for index, transcript in enumerate(transcripts):
+            if not transcript or transcript.isspace():
+                return json_response({'error': f'Transcript {index} cannot be empty'}, 400)
+        
+        # Evaluate every transcript in order
+        results = evaluate_introductions(transcripts, durations)
+        
+        return json_response({'results': results})
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Development server only; production runs under gunicorn (see Procfile)
+    app.run(host='0.0.0.0', port=5000, threaded=True)
 
@@ -4,71 +4,272 @@ Implements all rubric criteria with rule-based and NLP methods
 """
 
 import re
+from collections import Counter
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import islice
+import ahocorasick
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-import numpy as np
+
+class WindowedSentimentAnalyzer(SentimentIntensityAnalyzer):
+    """
+    VADER with linear-time negation and idiom checks.
+    vaderSentiment 3.3.2 lowercases the whole token list inside both checks for
+    every sentiment word; they only read the three tokens before and two after
+    position i, so passing that window gives identical scores.
+    """
+    
+    def _negation_check(self, valence, words_and_emoticons, start_i, i):
+        start = max(i - 3, 0)
+        return super()._negation_check(valence, words_and_emoticons[start:i + 3], start_i, i - start)
+    
+    def _special_idioms_check(self, valence, words_and_emoticons, i):
+        start = max(i - 3, 0)
+        return super()._special_idioms_check(valence, words_and_emoticons[start:i + 3], i - start)
 
 # Initialize NLP models
-sentiment_analyzer = SentimentIntensityAnalyzer()
+sentiment_analyzer = WindowedSentimentAnalyzer()
+# Score once at import so the first request doesn't pay for the cold lexicon
+sentiment_analyzer.polarity_scores('warmup')
+
+# Longest transcript kept in the sentiment cache, so it stays bounded in memory
+MAX_CACHED_TRANSCRIPT_LENGTH = 4096
+
+@lru_cache(maxsize=2048)
+def _cached_polarity_scores(transcript):
+    """VADER is deterministic, so repeated submissions of a transcript reuse its scores"""
+    return sentiment_analyzer.polarity_scores(transcript)
+
+def _polarity_scores(transcript):
+    """VADER scores, cached only for transcripts of introduction length"""
+    if len(transcript) > MAX_CACHED_TRANSCRIPT_LENGTH:
+        return sentiment_analyzer.polarity_scores(transcript)
+    return _cached_polarity_scores(transcript)
 
 # Filler words list
-FILLER_WORDS = ['um', 'uh', 'like', 'you know', 'so', 'actually', 'basically', 
-                'right', 'i mean', 'well', 'kinda', 'sort of', 'okay', 'hmm', 'ah']
+FILLER_WORDS = ('um', 'uh', 'like', 'you know', 'so', 'actually', 'basically',
+                'right', 'i mean', 'well', 'kinda', 'sort of', 'okay', 'hmm', 'ah')
+
+# Salutation phrases by level
+EXCELLENT_SALUTATIONS = ('excited to introduce', 'feeling great')
+GOOD_SALUTATIONS = ('good morning', 'good afternoon', 'good evening', 'good day', 'hello everyone')
+BASIC_SALUTATIONS = ('hi', 'hello')
+
+# Phrases that introduce the speaker's name, and that close the introduction
+NAME_TOKENS = ('name', 'myself', 'i am', "i'm")
+CLOSE_TOKENS = ('thank', 'thanks', 'listening')
+
+# Must-have keywords (4 points each, max 20 points)
+MUST_HAVE_KEYWORDS = {
+    'name': NAME_TOKENS,
+    'age': ('years old', 'age', 'year old'),
+    'school/class': ('class', 'school', 'studying', 'student'),
+    'family': ('family', 'father', 'mother', 'parents', 'brother', 'sister'),
+    'hobbies': ('hobby', 'hobbies', 'enjoy', 'like', 'love', 'play', 'playing')
+}
+
+# Good-to-have keywords (2 points each, max 10 points)
+GOOD_TO_HAVE_KEYWORDS = {
+    'about family': ('kind', 'loving', 'caring', 'supportive'),
+    'origin': ('from', 'live in', 'come from'),
+    'ambition/goal': ('ambition', 'goal', 'dream', 'want to', 'aspire'),
+    'fun fact': ('fun fact', 'interesting', 'unique', 'special'),
+    'strengths': ('good at', 'strength', 'achievement', 'proud')
+}
+
+# Flow markers: salutation -> name -> details -> closing
+FLOW_MARKERS = {
+    'greeting': ('hello', 'hi', 'good morning', 'good afternoon', 'good evening'),
+    'name': NAME_TOKENS,
+    'closing': CLOSE_TOKENS
+}
+
+# A non-empty sentence, from its first visible character up to the next '.'
+SENTENCE_RE = re.compile(r'[^.\s][^.]*')
+
+# Straight or typographic apostrophe, as pasted from word processors
+APOSTROPHE = r"(?:'|’)"
+# Auxiliaries that make "he have" part of a question ("does he have a pet?")
+QUESTION_AUXILIARIES = ('do', 'does', 'did', 'would', 'could', 'will', 'can', 'should', 'may', 'might', 'must')
+# Common grammar slips in student introductions (matched as whole words)
+GRAMMAR_ERROR_PATTERNS = (
+    rf"i (?:is|are|has|does|doesn{APOSTROPHE}t)",
+    ''.join(rf"(?<!\b{aux} )" for aux in QUESTION_AUXILIARIES) + rf"(?:he|she|it) (?:are|have|don{APOSTROPHE}t)",
+    rf"(?:we|they|you) (?:is|was|has|doesn{APOSTROPHE}t)",
+    rf"(?:don|doesn|didn){APOSTROPHE}t has",
+    r"myself is",
+    r"more (?:better|worse|bigger|smaller|happier|easier)"
+)
+# Slips that only count at the start of a sentence
+SENTENCE_START_ERROR_PATTERNS = (
+    r"me and my",
+)
+# Hoisting the shared \b keeps the engine from retrying every branch per char
+GRAMMAR_PATTERN = (
+    r'\b(?:' + '|'.join(GRAMMAR_ERROR_PATTERNS) + r')\b'
+    r'|(?:^|[.!?]\s*)(?:' + '|'.join(SENTENCE_START_ERROR_PATTERNS) + r')\b'
+)
+GRAMMAR_RE = re.compile(GRAMMAR_PATTERN)
+# ASCII text scans faster as bytes; \b and \s only agree with str there
+GRAMMAR_BYTES_RE = re.compile(GRAMMAR_PATTERN.encode())
+
+# Score bands, looked up with bisect instead of if/elif ladders
+# Speech rate: upper WPM bound of each band (bisect_left)
+WPM_THRESHOLDS = (80, 110, 140, 160)
+# Slowest rate that still counts as Acceptable; 80-81 WPM stays Too slow
+MIN_ACCEPTABLE_WPM = 81
+WPM_SCORES = (2, 6, 10, 6, 2)
+WPM_LABELS = ('Too slow', 'Acceptable speech rate', 'Ideal speech rate',
+              'Acceptable speech rate', 'Too fast')
+# Grammar: grammar_score >= threshold earns the next score up (bisect_right)
+GRAMMAR_THRESHOLDS = (0.3, 0.5, 0.7, 0.9)
+GRAMMAR_SCORES = (2, 4, 6, 8, 10)
+# Vocabulary: TTR >= threshold earns the next score up (bisect_right)
+TTR_THRESHOLDS = (0.3, 0.5, 0.7, 0.9)
+TTR_SCORES = (2, 4, 6, 8, 10)
+# Clarity: upper filler-rate bound (%) of each band (bisect_left)
+FILLER_RATE_THRESHOLDS = (3, 6, 9, 12)
+FILLER_RATE_SCORES = (15, 12, 9, 6, 3)
+# Engagement: positive score >= threshold earns the next score up (bisect_right)
+POSITIVE_THRESHOLDS = (0.3, 0.5, 0.7, 0.9)
+POSITIVE_SCORES = (3, 6, 9, 12, 15)
+
+def _is_word_char(char):
+    """Mirrors the regex \\w class used for word boundaries"""
+    return char.isalnum() or char == '_'
+
+# Word tokens, split exactly where the whole-word check puts boundaries
+WORD_RE = re.compile(r'\w+')
+# Same split for ASCII text as bytes, done by blanking every non-word byte
+ASCII_NON_WORD = bytes(code if _is_word_char(chr(code)) else ord(' ') for code in range(256))
+
+def _build_keyword_table():
+    """
+    Splits the rubric tables into a per-token bitmask lookup for single words,
+    and parallel per-phrase tuples (structure of arrays) plus an Aho-Corasick
+    automaton whose values index into them for everything else
+    """
+    category_bits = {}
+    entries = {}  # phrase -> [category bits, is filler, flow markers]
+    
+    # Every salutation level and keyword category gets one bit
+    groups = [
+        ('salutation', {'excellent': EXCELLENT_SALUTATIONS, 'good': GOOD_SALUTATIONS,
+                        'basic': BASIC_SALUTATIONS}),
+        ('must_have', MUST_HAVE_KEYWORDS),
+        ('good_to_have', GOOD_TO_HAVE_KEYWORDS)
+    ]
+    for bucket, categories in groups:
+        for category, phrases in categories.items():
+            bit = 1 << len(category_bits)
+            category_bits[bucket, category] = bit
+            for phrase in phrases:
+                entries.setdefault(phrase, [0, 0, ()])[0] |= bit
+    
+    # A phrase may serve several roles (e.g. 'like' is a filler and a hobby)
+    for phrase in FILLER_WORDS:
+        entries.setdefault(phrase, [0, 0, ()])[1] = 1
+    for marker, phrases in FLOW_MARKERS.items():
+        for phrase in phrases:
+            entries.setdefault(phrase, [0, 0, ()])[2] += (marker,)
+    
+    # Single words whose offsets flow doesn't need become one dict entry each,
+    # with fillers flagged by the bit above the categories
+    filler_shift = len(category_bits)
+    token_mask = {}
+    for phrase, (bits, is_filler, flow_markers) in list(entries.items()):
+        if WORD_RE.fullmatch(phrase) and not flow_markers:
+            token_mask[phrase.encode()] = bits | (is_filler << filler_shift)
+            del entries[phrase]
+    
+    automaton = ahocorasick.Automaton()
+    for index, phrase in enumerate(entries):
+        automaton.add_word(phrase, index)
+    automaton.make_automaton()
+    
+    lengths = tuple(len(phrase) for phrase in entries)
+    bits, is_filler, flow_markers = (tuple(column) for column in zip(*entries.values()))
+    return (category_bits, token_mask, filler_shift,
+            automaton, lengths, bits, is_filler, flow_markers)
 
-def evaluate_salutation(transcript):
+(CATEGORY_BITS, TOKEN_MASK, FILLER_SHIFT,
+ KEYWORD_AUTOMATON, PHRASE_LENGTHS, PHRASE_CATEGORY_BITS,
+ PHRASE_IS_FILLER, PHRASE_FLOW_MARKERS) = _build_keyword_table()
+
+def _is_whole_word(text, start, end):
+    """Checks that text[start:end + 1] is not part of a longer word"""
+    if start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if end + 1 < len(text) and _is_word_char(text[end + 1]):
+        return False
+    return True
+
+def scan_transcript(text_lower):
+    """Collects every rubric hit: single words by token lookup, phrases by automaton"""
+    categories = 0
+    filler_count = 0
+    flow = {marker: [] for marker in FLOW_MARKERS}
+    
+    # One count pass, then one intersection picks out the rubric words; only those need a Python step
+    if text_lower.isascii():
+        token_counts = Counter(text_lower.encode().translate(ASCII_NON_WORD).split())
+    else:
+        token_counts = Counter(word.encode() for word in WORD_RE.findall(text_lower))
+    for word in TOKEN_MASK.keys() & token_counts.keys():
+        mask = TOKEN_MASK[word]
+        categories |= mask
+        if (mask >> FILLER_SHIFT) & 1:
+            filler_count += token_counts[word]
+    categories &= (1 << FILLER_SHIFT) - 1
+    
+    for end, index in KEYWORD_AUTOMATON.iter(text_lower):
+        # Phrases only count as whole words ('hi' is not in 'this', 'so' is not in 'also')
+        if not _is_whole_word(text_lower, end - PHRASE_LENGTHS[index] + 1, end):
+            continue
+        categories |= PHRASE_CATEGORY_BITS[index]
+        filler_count += PHRASE_IS_FILLER[index]
+        for marker in PHRASE_FLOW_MARKERS[index]:
+            flow[marker].append(end)
+    
+    return {'categories': categories, 'filler_count': filler_count, 'flow': flow}
+
+def evaluate_salutation(hits):
     """Evaluates salutation level (0-5 points)"""
-    text_lower = transcript.lower()
+    found = hits['categories']
     
     # Excellent (5 points)
-    if 'excited to introduce' in text_lower or 'feeling great' in text_lower:
+    if found & CATEGORY_BITS['salutation', 'excellent']:
         return {'score': 5, 'level': 'Excellent', 'feedback': 'Excellent greeting with enthusiasm'}
     
     # Good (4 points)
-    good_greetings = ['good morning', 'good afternoon', 'good evening', 'good day', 'hello everyone']
-    if any(greet in text_lower for greet in good_greetings):
+    if found & CATEGORY_BITS['salutation', 'good']:
         return {'score': 4, 'level': 'Good', 'feedback': 'Good formal greeting'}
     
     # Normal (2 points)
-    if 'hi' in text_lower or 'hello' in text_lower:
+    if found & CATEGORY_BITS['salutation', 'basic']:
         return {'score': 2, 'level': 'Normal', 'feedback': 'Basic greeting found'}
     
     # No salutation (0 points)
     return {'score': 0, 'level': 'None', 'feedback': 'No greeting detected'}
 
-def evaluate_keyword_presence(transcript):
-    """Evaluates keyword presence (0-30 points)"""
-    text_lower = transcript.lower()
+def _score_keywords(found):
+    """Scores one combination of keyword category hits"""
     score = 0
     found_keywords = []
     missing_keywords = []
     
     # Must-have keywords (4 points each, max 20 points)
-    must_have = {
-        'name': ['name', 'myself', 'i am', "i'm"],
-        'age': ['years old', 'age', 'year old'],
-        'school/class': ['class', 'school', 'studying', 'student'],
-        'family': ['family', 'father', 'mother', 'parents', 'brother', 'sister'],
-        'hobbies': ['hobby', 'hobbies', 'enjoy', 'like', 'love', 'play', 'playing']
-    }
-    
-    for category, keywords in must_have.items():
-        if any(kw in text_lower for kw in keywords):
+    for category in MUST_HAVE_KEYWORDS:
+        if found & CATEGORY_BITS['must_have', category]:
             score += 4
             found_keywords.append(category)
         else:
             missing_keywords.append(category)
     
     # Good-to-have keywords (2 points each, max 10 points)
-    good_to_have = {
-        'about family': ['kind', 'loving', 'caring', 'supportive'],
-        'origin': ['from', 'live in', 'come from'],
-        'ambition/goal': ['ambition', 'goal', 'dream', 'want to', 'aspire'],
-        'fun fact': ['fun fact', 'interesting', 'unique', 'special'],
-        'strengths': ['good at', 'strength', 'achievement', 'proud']
-    }
-    
     good_count = 0
-    for category, keywords in good_to_have.items():
-        if any(kw in text_lower for kw in keywords):
+    for category in GOOD_TO_HAVE_KEYWORDS:
+        if found & CATEGORY_BITS['good_to_have', category]:
             good_count += 1
             found_keywords.append(category)
     
@@ -81,32 +282,55 @@ def evaluate_keyword_presence(transcript):
         'feedback': f'Found {len(found_keywords)} keywords. Missing: {", ".join(missing_keywords) if missing_keywords else "None"}'
     }
 
-def evaluate_flow(transcript):
+def _build_keyword_results():
+    """Pre-scores every combination of keyword hits, specializing the rubric at import"""
+    keyword_bits = 0
+    for (bucket, category), bit in CATEGORY_BITS.items():
+        if bucket in ('must_have', 'good_to_have'):
+            keyword_bits |= bit
+    
+    # Walk every submask of keyword_bits
+    results = {}
+    found = keyword_bits
+    while True:
+        results[found] = _score_keywords(found)
+        if found == 0:
+            break
+        found = (found - 1) & keyword_bits
+    return keyword_bits, results
+
+KEYWORD_BITS, KEYWORD_RESULTS = _build_keyword_results()
+
+def evaluate_keyword_presence(hits):
+    """Evaluates keyword presence (0-30 points)"""
+    result = KEYWORD_RESULTS[hits['categories'] & KEYWORD_BITS]
+    # The table is shared across requests, so hand out fresh lists
+    return {**result, 'found': list(result['found']), 'missing': list(result['missing'])}
+
+def evaluate_flow(text_lower, hits):
     """Evaluates introduction flow/order (0-5 points)"""
     # Simple order check: salutation -> name -> details -> closing
-    text_lower = transcript.lower()
-    sentences = [s.strip() for s in transcript.split('.') if s.strip()]
-    
+    # Marker offsets are compared against sentence ends; only the first three
+    # sentences and whatever follows the last closing marker are ever scanned
+    markers = hits['flow']
+    first_sentences = list(islice(SENTENCE_RE.finditer(text_lower), 3))
     has_salutation_first = False
     has_name_early = False
     has_closing = False
     
-    if len(sentences) >= 2:
-        first_sentence = sentences[0].lower()
-        if any(greet in first_sentence for greet in ['hello', 'hi', 'good morning', 'good afternoon', 'good evening']):
-            has_salutation_first = True
+    if len(first_sentences) >= 2:
+        first_end = first_sentences[0].end()
+        has_salutation_first = any(end < first_end for end in markers['greeting'])
     
     # Check if name appears in first 3 sentences
-    for i in range(min(3, len(sentences))):
-        if any(word in sentences[i].lower() for word in ['name', 'myself', 'i am', "i'm"]):
-            has_name_early = True
-            break
+    if first_sentences:
+        third_end = first_sentences[-1].end()
+        has_name_early = any(end < third_end for end in markers['name'])
     
-    # Check for closing
-    if sentences:
-        last_sentence = sentences[-1].lower()
-        if any(word in last_sentence for word in ['thank', 'thanks', 'listening']):
-            has_closing = True
+    # Check for closing in the last sentence: no sentence follows the latest marker
+    if markers['closing']:
+        next_stop = text_lower.find('.', markers['closing'][-1])
+        has_closing = next_stop == -1 or SENTENCE_RE.search(text_lower, next_stop) is None
     
     if has_salutation_first and has_name_early and has_closing:
         return {'score': 5, 'feedback': 'Excellent flow with proper order'}
@@ -117,46 +341,26 @@ def evaluate_flow(transcript):
     else:
         return {'score': 0, 'feedback': 'Flow order not followed'}
 
-def evaluate_speech_rate(transcript, duration_sec=52):
+def evaluate_speech_rate(word_count, duration_sec=52):
     """Evaluates speech rate (0-10 points)"""
-    words = transcript.split()
-    word_count = len(words)
     wpm = (word_count / duration_sec) * 60
     
-    if 111 <= wpm <= 140:
-        score = 10
-        feedback = f'Ideal speech rate: {wpm:.1f} WPM'
-    elif 141 <= wpm <= 160 or 81 <= wpm <= 110:
-        score = 6
-        feedback = f'Acceptable speech rate: {wpm:.1f} WPM'
-    elif wpm > 160:
-        score = 2
-        feedback = f'Too fast: {wpm:.1f} WPM'
-    else:
-        score = 2
-        feedback = f'Too slow: {wpm:.1f} WPM'
+    band = bisect_left(WPM_THRESHOLDS, wpm) if wpm >= MIN_ACCEPTABLE_WPM else 0
+    feedback = f'{WPM_LABELS[band]}: {wpm:.1f} WPM'
     
-    return {'score': score, 'wpm': round(wpm, 1), 'feedback': feedback}
+    return {'score': WPM_SCORES[band], 'wpm': round(wpm, 1), 'feedback': feedback}
 
-def evaluate_grammar(transcript):
+def evaluate_grammar(text_lower, word_count):
     """Evaluates grammar errors (0-10 points)"""
-        # Simple grammar check - give average score since Java-based LanguageTool not available
-    matches = []  # No grammar checking without Java
-    word_count = len(transcript.split())
-    errors_per_100 = (len(matches) / word_count) * 100 if word_count > 0 else 0
+    # Rule-based check against common mistakes; LanguageTool needs Java
+    if text_lower.isascii():
+        matches = GRAMMAR_BYTES_RE.findall(text_lower.encode())
+    else:
+        matches = GRAMMAR_RE.findall(text_lower)
+    errors_per_100 = len(matches) * 100 / max(word_count, 1)
     
     grammar_score = max(0, 1 - min(errors_per_100 / 10, 1))
-    
-    if grammar_score >= 0.9:
-        score = 10
-    elif grammar_score >= 0.7:
-        score = 8
-    elif grammar_score >= 0.5:
-        score = 6
-    elif grammar_score >= 0.3:
-        score = 4
-    else:
-        score = 2
+    score = GRAMMAR_SCORES[bisect_right(GRAMMAR_THRESHOLDS, grammar_score)]
     
     return {
         'score': score,
@@ -165,54 +369,30 @@ def evaluate_grammar(transcript):
         'feedback': f'{len(matches)} grammar errors found ({errors_per_100:.1f} per 100 words)'
     }
 
-def evaluate_vocabulary(transcript):
+def evaluate_vocabulary(word_counts):
     """Evaluates vocabulary richness using TTR (0-10 points)"""
-    words = transcript.lower().split()
-    unique_words = set(words)
-    total_words = len(words)
+    unique_words = len(word_counts)
+    total_words = word_counts.total()
     
     if total_words == 0:
         return {'score': 0, 'ttr': 0, 'feedback': 'No words found'}
     
-    ttr = len(unique_words) / total_words
-    
-    if ttr >= 0.9:
-        score = 10
-    elif ttr >= 0.7:
-        score = 8
-    elif ttr >= 0.5:
-        score = 6
-    elif ttr >= 0.3:
-        score = 4
-    else:
-        score = 2
+    ttr = unique_words / total_words
+    score = TTR_SCORES[bisect_right(TTR_THRESHOLDS, ttr)]
     
     return {
         'score': score,
         'ttr': round(ttr, 3),
-        'unique_words': len(unique_words),
+        'unique_words': unique_words,
         'total_words': total_words,
-        'feedback': f'TTR: {ttr:.3f} ({len(unique_words)}/{total_words} unique words)'
+        'feedback': f'TTR: {ttr:.3f} ({unique_words}/{total_words} unique words)'
     }
 
-def evaluate_clarity(transcript):
+def evaluate_clarity(hits, word_count):
     """Evaluates filler word rate (0-15 points)"""
-    text_lower = transcript.lower()
-    word_count = len(transcript.split())
-    
-    filler_count = sum(text_lower.count(filler) for filler in FILLER_WORDS)
+    filler_count = hits['filler_count']
     filler_rate = (filler_count / word_count) * 100 if word_count > 0 else 0
-    
-    if filler_rate <= 3:
-        score = 15
-    elif filler_rate <= 6:
-        score = 12
-    elif filler_rate <= 9:
-        score = 9
-    elif filler_rate <= 12:
-        score = 6
-    else:
-        score = 3
+    score = FILLER_RATE_SCORES[bisect_left(FILLER_RATE_THRESHOLDS, filler_rate)]
     
     return {
         'score': score,
@@ -223,19 +403,10 @@ def evaluate_clarity(transcript):
 
 def evaluate_engagement(transcript):
     """Evaluates sentiment/positivity (0-15 points)"""
-    scores = sentiment_analyzer.polarity_scores(transcript)
+    # Copy so the cached scores can't be mutated through the response
+    scores = dict(_polarity_scores(transcript))
     positive_score = scores['pos']
-    
-    if positive_score >= 0.9:
-        score = 15
-    elif positive_score >= 0.7:
-        score = 12
-    elif positive_score >= 0.5:
-        score = 9
-    elif positive_score >= 0.3:
-        score = 6
-    else:
-        score = 3
+    score = POSITIVE_SCORES[bisect_right(POSITIVE_THRESHOLDS, positive_score)]
     
     return {
         'score': score,
@@ -246,25 +417,30 @@ def evaluate_engagement(transcript):
 
 def evaluate_introduction(transcript, duration_sec=52):
     """Main evaluation function that combines all criteria"""
+    # Lowercase, tokenize and sweep for keywords once; every criterion reuses these
+    text_lower = transcript.lower()
+    word_counts = Counter(text_lower.split())
+    word_count = word_counts.total()
+    hits = scan_transcript(text_lower)
     
     # Content & Structure (40 points)
-    salutation = evaluate_salutation(transcript)
-    keywords = evaluate_keyword_presence(transcript)
-    flow = evaluate_flow(transcript)
+    salutation = evaluate_salutation(hits)
+    keywords = evaluate_keyword_presence(hits)
+    flow = evaluate_flow(text_lower, hits)
     
     content_score = salutation['score'] + keywords['score'] + flow['score']
     
     # Speech Rate (10 points)
-    speech = evaluate_speech_rate(transcript, duration_sec)
+    speech = evaluate_speech_rate(word_count, duration_sec)
     
     # Language & Grammar (20 points)
-    grammar = evaluate_grammar(transcript)
-    vocabulary = evaluate_vocabulary(transcript)
+    grammar = evaluate_grammar(text_lower, word_count)
+    vocabulary = evaluate_vocabulary(word_counts)
     
     language_score = grammar['score'] + vocabulary['score']
     
     # Clarity (15 points)
-    clarity = evaluate_clarity(transcript)
+    clarity = evaluate_clarity(hits, word_count)
     
     # Engagement (15 points)
     engagement = evaluate_engagement(transcript)
@@ -307,8 +483,47 @@ def evaluate_introduction(transcript, duration_sec=52):
                 'details': engagement
             }
         },
-        'word_count': len(transcript.split()),
+        'word_count': word_count,
         'duration_sec': duration_sec
     }
     
     return results
+
+def evaluate_introductions(transcripts, durations):
+    """Evaluates a batch of introductions one after another"""
+    return [
+        evaluate_introduction(transcript, duration_sec)
+        for transcript, duration_sec in zip(transcripts, durations)
+    ]
+
+# Raw-transcript wrappers for callers (and tests) that score one criterion at a time
+def evaluate_salutation_text(transcript):
+    """evaluate_salutation for a raw transcript"""
+    return evaluate_salutation(scan_transcript(transcript.lower()))
+
+def evaluate_keyword_presence_text(transcript):
+    """evaluate_keyword_presence for a raw transcript"""
+    return evaluate_keyword_presence(scan_transcript(transcript.lower()))
+
+def evaluate_flow_text(transcript):
+    """evaluate_flow for a raw transcript"""
+    text_lower = transcript.lower()
+    return evaluate_flow(text_lower, scan_transcript(text_lower))
+
+def evaluate_speech_rate_text(transcript, duration_sec=52):
+    """evaluate_speech_rate for a raw transcript"""
+    return evaluate_speech_rate(len(transcript.split()), duration_sec)
+
+def evaluate_grammar_text(transcript):
+    """evaluate_grammar for a raw transcript"""
+    text_lower = transcript.lower()
+    return evaluate_grammar(text_lower, len(text_lower.split()))
+
+def evaluate_vocabulary_text(transcript):
+    """evaluate_vocabulary for a raw transcript"""
+    return evaluate_vocabulary(Counter(transcript.lower().split()))
+
+def evaluate_clarity_text(transcript):
+    """evaluate_clarity for a raw transcript"""
+    text_lower = transcript.lower()
+    return evaluate_clarity(scan_transcript(text_lower), len(text_lower.split()))